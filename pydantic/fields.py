@@ -721,20 +721,23 @@ class ModelField(Representation):
             self.shape = SHAPE_SEQUENCE
         # priority to most common mapping: dict
         elif origin is dict or origin is Dict:
-            self.key_field = self._create_sub_type(get_args(self.type_)[0], 'key_' + self.name, for_keys=True)
-            self.type_ = get_args(self.type_)[1]
+            args = get_args(self.type_)
+            self.key_field = self._create_sub_type(args[0], 'key_' + self.name, for_keys=True)
+            self.type_ = args[1]
             self.shape = SHAPE_DICT
         elif issubclass(origin, DefaultDict):
-            self.key_field = self._create_sub_type(get_args(self.type_)[0], 'key_' + self.name, for_keys=True)
-            self.type_ = get_args(self.type_)[1]
+            args = get_args(self.type_)
+            self.key_field = self._create_sub_type(args[0], 'key_' + self.name, for_keys=True)
+            self.type_ = args[1]
             self.shape = SHAPE_DEFAULTDICT
         elif issubclass(origin, Counter):
             self.key_field = self._create_sub_type(get_args(self.type_)[0], 'key_' + self.name, for_keys=True)
             self.type_ = int
             self.shape = SHAPE_COUNTER
         elif issubclass(origin, Mapping):
-            self.key_field = self._create_sub_type(get_args(self.type_)[0], 'key_' + self.name, for_keys=True)
-            self.type_ = get_args(self.type_)[1]
+            args = get_args(self.type_)
+            self.key_field = self._create_sub_type(args[0], 'key_' + self.name, for_keys=True)
+            self.type_ = args[1]
             self.shape = SHAPE_MAPPING
         # Equality check as almost everything inherits form Iterable, including str
         # check for Iterable and CollectionsIterable, as it could receive one even when declared with the other
@@ -1230,6 +1233,8 @@ class DeferredType:
     Used to postpone field preparation, while creating recursive generic models.
     """
 
+    __slots__ = ()
+
 
 def is_finalvar_with_default_val(type_: Type[Any], val: Any) -> bool:
     return is_finalvar(type_) and val is not Undefined and not isinstance(val, FieldInfo)
@@ -68,7 +68,10 @@ from .types import (
     constr,
 )
 from .typing import (
+    ORIGIN_CALLABLE,
+    ORIGIN_LITERAL,
     all_literal_values,
+    classify_origin,
     get_args,
     get_origin,
     get_sub_types,
@@ -857,13 +860,14 @@ def field_singleton_schema(  # noqa: C901 (ignore complexity)
         return {}, definitions, nested_models  # no restrictions
     if is_none_type(field_type):
         return {'type': 'null'}, definitions, nested_models
-    if is_callable_type(field_type):
+    origin_kind = classify_origin(field_type)
+    if origin_kind == ORIGIN_CALLABLE:
         raise SkipField(f'Callable {field.name} was excluded from schema since JSON schema has no equivalent type.')
     f_schema: Dict[str, Any] = {}
     if field.field_info is not None and field.field_info.const:
         f_schema['const'] = field.default
 
-    if is_literal_type(field_type):
+    if origin_kind == ORIGIN_LITERAL:
         values = all_literal_values(field_type)
 
         if len({v.__class__ for v in values}) > 1:
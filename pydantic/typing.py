@@ -1,22 +1,22 @@
+import builtins
 import sys
+import typing
 from collections.abc import Callable
+from enum import Enum
+from functools import wraps
 from os import PathLike
+from types import FunctionType
 from typing import (  # type: ignore
     TYPE_CHECKING,
-    AbstractSet,
     Any,
     Callable as TypingCallable,
     ClassVar,
     Dict,
     ForwardRef,
-    Generator,
     Iterable,
     List,
-    Mapping,
     NewType,
     Optional,
-    Sequence,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -26,6 +26,7 @@ from typing import (  # type: ignore
     get_type_hints,
 )
 
+import typing_extensions
 from typing_extensions import (
     Annotated,
     Final,
@@ -89,12 +90,58 @@ AnyArgTCallable = TypingCallable[..., _T]
 # Annotated[...] is implemented by returning an instance of one of these classes, depending on
 # python/typing_extensions version.
 AnnotatedTypeNames = {'AnnotatedMeta', '_AnnotatedAlias'}
+# the classes themselves, so that `get_origin` and `get_args` can use a single `isinstance` check
+_ANNOTATED_TYPES: Tuple[type, ...] = tuple(
+    filter(
+        None,
+        (
+            getattr(typing, '_AnnotatedAlias', None),
+            getattr(typing_extensions, '_AnnotatedAlias', None),
+            getattr(typing_extensions, 'AnnotatedMeta', None),
+        ),
+    )
+)
+
+
+# Upper bound on the number of entries held by each of the identity caches below
+_TYPE_CACHE_MAXSIZE = 4096
+
+
+def _cache_by_identity(func: TypingCallable[[Any], _T]) -> TypingCallable[[Any], _T]:
+    """
+    Memoize a single argument introspection helper on the identity of its argument.
+
+    `functools.lru_cache` isn't suitable here: typing objects aren't always hashable and, worse,
+    can compare equal while still differing in ways we care about, e.g. `Union[int, str] == Union[str, int]`.
+    The argument is kept alive alongside its result so its `id()` can't be reused while it's cached.
+    """
+    cache: Dict[int, Tuple[Any, _T]] = {}
+
+    @wraps(func)
+    def wrapper(tp: Any) -> _T:
+        try:
+            return cache[id(tp)][1]
+        except KeyError:
+            pass
+        result = func(tp)
+        if len(cache) >= _TYPE_CACHE_MAXSIZE:
+            cache.clear()
+        cache[id(tp)] = (tp, result)
+        return result
+
+    def cache_discard(tp: Any) -> None:
+        cache.pop(id(tp), None)
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    wrapper.cache_discard = cache_discard  # type: ignore[attr-defined]
+    return wrapper
 
 
 if sys.version_info < (3, 8):
 
+    @_cache_by_identity
     def get_origin(t: Type[Any]) -> Optional[Type[Any]]:
-        if type(t).__name__ in AnnotatedTypeNames:
+        if isinstance(t, _ANNOTATED_TYPES):
             # weirdly this is a runtime requirement, as well as for mypy
             return cast(Type[Any], Annotated)
         return getattr(t, '__origin__', None)
@@ -102,6 +149,7 @@ if sys.version_info < (3, 8):
 else:
     from typing import get_origin as _typing_get_origin
 
+    @_cache_by_identity
     def get_origin(tp: Type[Any]) -> Optional[Type[Any]]:
         """
         We can't directly use `typing.get_origin` since we need a fallback to support
@@ -109,21 +157,56 @@ else:
         It should be useless once https://github.com/cython/cython/issues/3537 is
         solved and https://github.com/pydantic/pydantic/pull/1753 is merged.
         """
-        if type(tp).__name__ in AnnotatedTypeNames:
+        if isinstance(tp, _ANNOTATED_TYPES):
             return cast(Type[Any], Annotated)  # mypy complains about _SpecialForm
         return _typing_get_origin(tp) or getattr(tp, '__origin__', None)
 
 
+# `(Any,) * n` for the small parameter counts bare generics have, so they don't need building on every call
+_ANY_TUPLES = tuple((Any,) * i for i in range(16))
+
+# built once since `tuple[()]` isn't cached by python
+if sys.version_info >= (3, 9):
+    _EMPTY_TUPLE_TYPES: Tuple[Any, ...] = (Tuple[()], tuple[()])  # type: ignore[misc]
+else:
+    _EMPTY_TUPLE_TYPES = (Tuple[()],)
+
+
+# only used by the python 3.8+ `get_args` below, but kept out of its version block as it doesn't depend on it
+def _generic_get_args(tp: Type[Any]) -> Tuple[Any, ...]:
+    """
+    In python 3.9, `typing.Dict`, `typing.List`, ...
+    do have an empty `__args__` by default (instead of the generic ~T for example).
+    In order to still support `Dict` for example and consider it as `Dict[Any, Any]`,
+    we retrieve the `_nparams` value that tells us how many parameters it needs.
+    """
+    nparams = getattr(tp, '_nparams', None)
+    if nparams is not None:
+        # `typing.Tuple` has `_nparams == -1`
+        return _ANY_TUPLES[nparams] if 0 <= nparams < len(_ANY_TUPLES) else (Any,) * nparams
+    # Special case for `tuple[()]`, which used to return ((),) with `typing.Tuple`
+    # in python 3.10- but now returns () for `tuple` and `Tuple`.
+    # This will probably be clarified in pydantic v2
+    try:
+        if tp in _EMPTY_TUPLE_TYPES:
+            return ((),)
+    # there is a TypeError when compiled with cython
+    except TypeError:  # pragma: no cover
+        pass
+    return ()
+
+
 if sys.version_info < (3, 8):
     from typing import _GenericAlias
 
+    @_cache_by_identity
     def get_args(t: Type[Any]) -> Tuple[Any, ...]:
         """Compatibility version of get_args for python 3.7.
 
         Mostly compatible with the python 3.8 `typing` module version
         and able to handle almost all use cases.
         """
-        if type(t).__name__ in AnnotatedTypeNames:
+        if isinstance(t, _ANNOTATED_TYPES):
             return t.__args__ + t.__metadata__
         if isinstance(t, _GenericAlias):
             res = t.__args__
@@ -135,26 +218,7 @@ if sys.version_info < (3, 8):
 else:
     from typing import get_args as _typing_get_args
 
-    def _generic_get_args(tp: Type[Any]) -> Tuple[Any, ...]:
-        """
-        In python 3.9, `typing.Dict`, `typing.List`, ...
-        do have an empty `__args__` by default (instead of the generic ~T for example).
-        In order to still support `Dict` for example and consider it as `Dict[Any, Any]`,
-        we retrieve the `_nparams` value that tells us how many parameters it needs.
-        """
-        if hasattr(tp, '_nparams'):
-            return (Any,) * tp._nparams
-        # Special case for `tuple[()]`, which used to return ((),) with `typing.Tuple`
-        # in python 3.10- but now returns () for `tuple` and `Tuple`.
-        # This will probably be clarified in pydantic v2
-        try:
-            if tp == Tuple[()] or sys.version_info >= (3, 9) and tp == tuple[()]:  # type: ignore[misc]
-                return ((),)
-        # there is a TypeError when compiled with cython
-        except TypeError:  # pragma: no cover
-            pass
-        return ()
-
+    @_cache_by_identity
     def get_args(tp: Type[Any]) -> Tuple[Any, ...]:
         """Get type arguments with all substitutions performed.
 
@@ -166,10 +230,17 @@ else:
             get_args(Union[int, Tuple[T, int]][str]) == (int, Tuple[str, int])
             get_args(Callable[[], T][int]) == ([], int)
         """
-        if type(tp).__name__ in AnnotatedTypeNames:
+        if isinstance(tp, _ANNOTATED_TYPES):
             return tp.__args__ + tp.__metadata__
+        args = _typing_get_args(tp)
+        if args:
+            return args
         # the fallback is needed for the same reasons as `get_origin` (see above)
-        return _typing_get_args(tp) or getattr(tp, '__args__', ()) or _generic_get_args(tp)
+        try:
+            args = tp.__args__
+        except AttributeError:
+            args = ()
+        return args or _generic_get_args(tp)
 
 
 if sys.version_info < (3, 9):
@@ -188,6 +259,7 @@ else:
 
     from typing_extensions import _AnnotatedAlias
 
+    @_cache_by_identity
     def convert_generics(tp: Type[Any]) -> Type[Any]:
         """
         Recursively searches for `str` type hints and replaces them with ForwardRef.
@@ -204,6 +276,10 @@ else:
 
         args = get_args(tp)
 
+        # nothing to convert, which is by far the most common case
+        if not any(isinstance(arg, str) or hasattr(arg, '__args__') for arg in args):
+            return tp
+
         # typing.Annotated needs special treatment
         if origin is Annotated:
             return _AnnotatedAlias(convert_generics(args[0]), args[1:])
@@ -226,6 +302,11 @@ else:
                 setattr(tp, '__args__', converted)
             except AttributeError:
                 pass
+            else:
+                # the cached arguments of `tp` are now stale, and so is the display of `tp`
+                # and of every alias it's nested in
+                get_args.cache_discard(tp)  # type: ignore[attr-defined]
+                _display_type.cache_clear()  # type: ignore[attr-defined]
             return tp
 
 
@@ -238,7 +319,6 @@ if sys.version_info < (3, 10):
 
 else:
     import types
-    import typing
 
     def is_union(tp: Optional[Type[Any]]) -> bool:
         return tp is Union or tp is types.UnionType  # noqa: E721
@@ -258,6 +338,8 @@ else:
 
 
 if TYPE_CHECKING:
+    from typing import AbstractSet, Generator, Mapping, Sequence, Set
+
     from .fields import ModelField
 
     TupleGenerator = Generator[Tuple[str, Any], None, None]
@@ -274,12 +356,17 @@ if TYPE_CHECKING:
     AnyClassMethod = classmethod[Any]
 
 __all__ = (
+    'ORIGIN_OTHER',
+    'ORIGIN_UNION',
+    'ORIGIN_LITERAL',
+    'ORIGIN_CALLABLE',
     'AnyCallable',
     'NoArgAnyCallable',
     'NoneType',
     'is_none_type',
     'display_as_type',
     'resolve_annotations',
+    'classify_origin',
     'is_callable_type',
     'is_literal_type',
     'all_literal_values',
@@ -292,18 +379,6 @@ __all__ = (
     'is_finalvar',
     'update_field_forward_refs',
     'update_model_forward_refs',
-    'TupleGenerator',
-    'DictStrAny',
-    'DictAny',
-    'SetStr',
-    'ListStr',
-    'IntStr',
-    'AbstractSetIntStr',
-    'DictIntStrAny',
-    'CallableGenerator',
-    'ReprArgs',
-    'AnyClassMethod',
-    'CallableGenerator',
     'WithArgsTypes',
     'get_args',
     'get_origin',
@@ -312,7 +387,6 @@ __all__ = (
     'get_all_type_hints',
     'is_union',
     'StrPath',
-    'MappingIntStrAny',
 )
 
 
@@ -346,19 +420,47 @@ elif sys.version_info[:2] == (3, 8):
         return False
 
 else:
+    # the same identity check as `type_ is none_type` for each of `NONE_TYPES`, in a single set lookup.
+    # `Literal[None]` isn't necessarily a singleton (e.g. with `typing_extensions.Literal`), so like that
+    # loop this only matches the `Literal[None]` object stored in `NONE_TYPES`
+    _NONE_TYPE_IDS = frozenset(id(none_type) for none_type in NONE_TYPES)
 
     def is_none_type(type_: Any) -> bool:
-        for none_type in NONE_TYPES:
-            if type_ is none_type:
-                return True
-        return False
+        return id(type_) in _NONE_TYPE_IDS
+
+
+def _display_name(v: Any) -> str:
+    return v.__name__
+
+
+def _display_class_name(v: Any) -> str:
+    return v.__class__.__name__
+
+
+# shortcuts for the exact types most commonly passed to `display_as_type`: plain classes are displayed
+# by name and instances of builtins by the name of their class, anything else takes the full path below
+_DISPLAY_DISPATCH: Dict[Any, TypingCallable[[Any], str]] = {
+    type: _display_name,
+    FunctionType: _display_class_name,
+    **{t: _display_class_name for t in (str, int, float, bool, bytes, NoneType, list, tuple, set, frozenset, dict)},
+}
 
 
 def display_as_type(v: Type[Any]) -> str:
+    display = _DISPLAY_DISPATCH.get(type(v))
+    if display is not None:
+        return display(v)
+
     if not isinstance(v, typing_base) and not isinstance(v, WithArgsTypes) and not isinstance(v, type):
         v = v.__class__
 
-    if is_union(get_origin(v)):
+    return _display_type(v)
+
+
+# cached on identity rather than equality, `Union[int, str] == Union[str, int]` but they aren't displayed the same
+@_cache_by_identity
+def _display_type(v: Type[Any]) -> str:
+    if classify_origin(v) == ORIGIN_UNION:
         return f'Union[{", ".join(map(display_as_type, get_args(v)))}]'
 
     if isinstance(v, WithArgsTypes):
@@ -372,12 +474,53 @@ def display_as_type(v: Type[Any]) -> str:
         return str(v).replace('typing.', '')
 
 
+if (3, 10) > sys.version_info >= (3, 9, 8) or sys.version_info >= (3, 10, 1):
+
+    def _class_forward_ref(value: str) -> ForwardRef:
+        return ForwardRef(value, is_argument=False, is_class=True)
+
+else:
+
+    def _class_forward_ref(value: str) -> ForwardRef:
+        return ForwardRef(value, is_argument=False)
+
+
+def _lookup_class(name: str, globalns: Optional[Dict[str, Any]]) -> Optional[Type[Any]]:
+    """
+    Shortcut for the most common string annotation, the name of a class: look it up in the module
+    namespace or builtins as `eval` would, without compiling it. Returns `None` for anything else.
+    """
+    if globalns is None or not name.isidentifier():
+        return None
+    try:
+        value = globalns[name]
+    except KeyError:
+        value = getattr(builtins, name, None)
+    # generic aliases pass for classes with python 3.9 and 3.10, they need evaluating
+    if isinstance(value, type) and not isinstance(value, WithArgsTypes):
+        return value
+    return None
+
+
+# Annotations known to resolve to themselves, keyed on the module and the identity of each raw annotation.
+# The raw annotations are kept in the entry so their `id()` can't be reused while they're cached.
+_RESOLVE_CACHE: Dict[
+    Tuple[Optional[str], Tuple[Tuple[str, int], ...]], Tuple[Tuple[Any, ...], Dict[str, Type[Any]]]
+] = {}
+
+
 def resolve_annotations(raw_annotations: Dict[str, Type[Any]], module_name: Optional[str]) -> Dict[str, Type[Any]]:
     """
     Partially taken from typing.get_type_hints.
 
     Resolve string or ForwardRef annotations into type objects if possible.
     """
+    cache_key = (module_name, tuple((name, id(value)) for name, value in raw_annotations.items()))
+    try:
+        return _RESOLVE_CACHE[cache_key][1].copy()
+    except KeyError:
+        pass
+
     base_globals: Optional[Dict[str, Any]] = None
     if module_name:
         try:
@@ -388,22 +531,59 @@ def resolve_annotations(raw_annotations: Dict[str, Type[Any]], module_name: Opti
         else:
             base_globals = module.__dict__
 
+    # only annotations which don't depend on the module namespace can be cached, anything
+    # containing a forward reference could resolve differently once that name is (re)bound
+    cacheable = True
     annotations = {}
-    for name, value in raw_annotations.items():
+    for name, raw_value in raw_annotations.items():
+        value = raw_value
         if isinstance(value, str):
-            if (3, 10) > sys.version_info >= (3, 9, 8) or sys.version_info >= (3, 10, 1):
-                value = ForwardRef(value, is_argument=False, is_class=True)
-            else:
-                value = ForwardRef(value, is_argument=False)
+            cls = _lookup_class(value, base_globals)
+            if cls is not None:
+                annotations[name] = cls
+                cacheable = False
+                continue
+            value = _class_forward_ref(value)
         try:
             value = _eval_type(value, base_globals, None)
         except NameError:
             # this is ok, it can be fixed with update_forward_refs
-            pass
+            cacheable = False
+        cacheable = cacheable and value is raw_value
         annotations[name] = value
+
+    if cacheable:
+        if len(_RESOLVE_CACHE) >= _TYPE_CACHE_MAXSIZE:
+            _RESOLVE_CACHE.clear()
+        _RESOLVE_CACHE[cache_key] = (tuple(raw_annotations.values()), annotations.copy())
     return annotations
 
 
+ORIGIN_OTHER = 0
+ORIGIN_UNION = 1
+ORIGIN_LITERAL = 2
+ORIGIN_CALLABLE = 3
+
+
+def classify_origin(type_: Type[Any]) -> int:
+    """
+    Classify a type by its origin as one of `ORIGIN_UNION`, `ORIGIN_LITERAL`, `ORIGIN_CALLABLE` or `ORIGIN_OTHER`,
+    so that code checking for several of them only looks the origin up once.
+    Like `is_callable_type`, a bare `Callable` is classified as `ORIGIN_CALLABLE`.
+    """
+    if type_ is Callable:
+        return ORIGIN_CALLABLE
+    # identity checks, like `is_union`, `is_literal_type` and `is_callable_type`
+    origin = get_origin(type_)
+    if is_union(origin):
+        return ORIGIN_UNION
+    if origin is Literal:
+        return ORIGIN_LITERAL
+    if origin is Callable:
+        return ORIGIN_CALLABLE
+    return ORIGIN_OTHER
+
+
 def is_callable_type(type_: Type[Any]) -> bool:
     return type_ is Callable or get_origin(type_) is Callable
 
@@ -416,6 +596,10 @@ def literal_values(type_: Type[Any]) -> Tuple[Any, ...]:
     return get_args(type_)
 
 
+# the only non-`Literal` values `Literal` accepts, these can skip the `is_literal_type` check
+_LITERAL_SCALAR_TYPES = (int, str, bytes, Enum, NoneType)
+
+
 def all_literal_values(type_: Type[Any]) -> Tuple[Any, ...]:
     """
     This method is used to retrieve all Literal values as
@@ -425,28 +609,46 @@ def all_literal_values(type_: Type[Any]) -> Tuple[Any, ...]:
     if not is_literal_type(type_):
         return (type_,)
 
-    values = literal_values(type_)
-    return tuple(x for value in values for x in all_literal_values(value))
+    values = []
+    # walk the nested literals depth first, the stack is reversed to keep the values in order
+    stack = list(reversed(literal_values(type_)))
+    while stack:
+        value = stack.pop()
+        if not isinstance(value, _LITERAL_SCALAR_TYPES) and is_literal_type(value):
+            stack.extend(reversed(literal_values(value)))
+        else:
+            values.append(value)
+    return tuple(values)
+
+
+def _lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:
+    """
+    `utils` imports this module, so `lenient_issubclass` can't be imported at the top:
+    the first call imports it and rebinds this name to it, so later calls go straight through.
+    """
+    global _lenient_issubclass
+    from .utils import lenient_issubclass
 
+    _lenient_issubclass = lenient_issubclass
+    return lenient_issubclass(cls, class_or_tuple)
 
+
+@_cache_by_identity
 def is_namedtuple(type_: Type[Any]) -> bool:
     """
     Check if a given class is a named tuple.
     It can be either a `typing.NamedTuple` or `collections.namedtuple`
     """
-    from .utils import lenient_issubclass
-
-    return lenient_issubclass(type_, tuple) and hasattr(type_, '_fields')
+    return _lenient_issubclass(type_, tuple) and hasattr(type_, '_fields')
 
 
+@_cache_by_identity
 def is_typeddict(type_: Type[Any]) -> bool:
     """
     Check if a given class is a typed dict (from `typing` or `typing_extensions`)
     In 3.10, there will be a public method (https://docs.python.org/3.10/library/typing.html#typing.is_typeddict)
     """
-    from .utils import lenient_issubclass
-
-    return lenient_issubclass(type_, dict) and hasattr(type_, '__total__')
+    return _lenient_issubclass(type_, dict) and hasattr(type_, '__total__')
 
 
 def _check_typeddict_special(type_: Any) -> bool:
@@ -476,21 +678,31 @@ def new_type_supertype(type_: Type[Any]) -> Type[Any]:
     return type_
 
 
+_CLASSVAR_TYPE = type(ClassVar)
+_FINAL_TYPE = type(Final)
+
+
 def _check_classvar(v: Optional[Type[Any]]) -> bool:
-    if v is None:
-        return False
+    # special forms always have a `_name`, it's interned like the literal so `==` returns on the identity check
+    return type(v) is _CLASSVAR_TYPE and v._name == 'ClassVar'
 
-    return v.__class__ == ClassVar.__class__ and getattr(v, '_name', None) == 'ClassVar'
 
+if sys.version_info < (3, 8):
 
-def _check_finalvar(v: Optional[Type[Any]]) -> bool:
-    """
-    Check if a given type is a `typing.Final` type.
-    """
-    if v is None:
-        return False
+    def _check_finalvar(v: Optional[Type[Any]]) -> bool:
+        """
+        Check if a given type is a `typing.Final` type.
+        """
+        return type(v) is _FINAL_TYPE
+
+else:
 
-    return v.__class__ == Final.__class__ and (sys.version_info < (3, 8) or getattr(v, '_name', None) == 'Final')
+    def _check_finalvar(v: Optional[Type[Any]]) -> bool:
+        """
+        Check if a given type is a `typing.Final` type.
+        """
+        # `Final` shares its class with the other special forms, e.g. `ClassVar`
+        return type(v) is _FINAL_TYPE and v._name == 'Final'
 
 
 def is_classvar(ann_type: Type[Any]) -> bool:
@@ -499,7 +711,7 @@ def is_classvar(ann_type: Type[Any]) -> bool:
 
     # this is an ugly workaround for class vars that contain forward references and are therefore themselves
     # forward references, see #3679
-    if ann_type.__class__ == ForwardRef and ann_type.__forward_arg__.startswith('ClassVar['):
+    if ann_type.__class__ is ForwardRef and ann_type.__forward_arg__.startswith('ClassVar['):
         return True
 
     return False
@@ -31,12 +31,13 @@ from uuid import UUID
 from . import errors
 from .datetime_parse import parse_date, parse_datetime, parse_duration, parse_time
 from .typing import (
+    ORIGIN_CALLABLE,
+    ORIGIN_LITERAL,
     AnyCallable,
     all_literal_values,
+    classify_origin,
     display_as_type,
     get_class,
-    is_callable_type,
-    is_literal_type,
     is_namedtuple,
     is_none_type,
     is_typeddict,
@@ -715,10 +716,11 @@ def find_validators(  # noqa: C901 (ignore complexity)
     if type_ is Hashable or type_ is CollectionsHashable:
         yield hashable_validator
         return
-    if is_callable_type(type_):
+    origin_kind = classify_origin(type_)
+    if origin_kind == ORIGIN_CALLABLE:
         yield callable_validator
         return
-    if is_literal_type(type_):
+    if origin_kind == ORIGIN_LITERAL:
         yield make_literal_validator(type_)
         return
     if is_builtin_dataclass(type_):
@@ -1,12 +1,29 @@
 import sys
 from collections import namedtuple
+from collections.abc import Callable
 from typing import Any, Callable as TypingCallable, Dict, ForwardRef, List, NamedTuple, NewType, Union  # noqa: F401
 
 import pytest
 from typing_extensions import Annotated  # noqa: F401
 
 from pydantic import Field  # noqa: F401
-from pydantic.typing import Literal, convert_generics, is_namedtuple, is_none_type, is_typeddict
+from pydantic.typing import (
+    ORIGIN_CALLABLE,
+    ORIGIN_LITERAL,
+    ORIGIN_OTHER,
+    ORIGIN_UNION,
+    Literal,
+    classify_origin,
+    convert_generics,
+    get_args,
+    get_origin,
+    is_callable_type,
+    is_literal_type,
+    is_namedtuple,
+    is_none_type,
+    is_typeddict,
+    is_union,
+)
 
 try:
     from typing import TypedDict as typing_TypedDict
@@ -41,6 +58,8 @@ def test_is_namedtuple():
         id: int
 
     assert is_namedtuple(Other) is False
+    # not hashable
+    assert is_namedtuple(Annotated[int, {}]) is False
 
 
 @pytest.mark.parametrize('TypedDict', (t for t in ALL_TYPEDDICT_KINDS if t is not None))
@@ -71,6 +90,25 @@ def test_is_none_type():
     assert is_none_type(TypingCallable) is False
 
 
+@pytest.mark.parametrize(
+    'type_,expected',
+    [
+        (Union[int, str], ORIGIN_UNION),
+        (Literal[1, 2], ORIGIN_LITERAL),
+        (TypingCallable[[int], str], ORIGIN_CALLABLE),
+        (Callable, ORIGIN_CALLABLE),
+        (List[int], ORIGIN_OTHER),
+        (int, ORIGIN_OTHER),
+    ],
+)
+def test_classify_origin(type_, expected):
+    assert classify_origin(type_) == expected
+    # must agree with the single purpose checks
+    assert is_union(get_origin(type_)) is (expected == ORIGIN_UNION)
+    assert is_literal_type(type_) is (expected == ORIGIN_LITERAL)
+    assert is_callable_type(type_) is (expected == ORIGIN_CALLABLE)
+
+
 class Hero:
     pass
 
@@ -124,3 +162,45 @@ def test_convert_generics_pep604():
     assert (
         convert_generics(dict['Hero', list['Team']] | int) == dict[ForwardRef('Hero'), list[ForwardRef('Team')]] | int
     )
+
+
+def test_get_args_cache_uses_identity():
+    # `Union[int, str] == Union[str, int]`, the cache must not mix them up
+    assert get_args(Union[int, str]) == (int, str)
+    assert get_args(Union[str, int]) == (str, int)
+    assert get_origin(Union[str, int]) is Union
+
+    get_args.cache_clear()
+    get_origin.cache_clear()
+    assert get_args(Union[str, int]) == (str, int)
+
+
+def test_cached_helpers_keep_their_names():
+    assert get_origin.__name__ == get_origin.__qualname__ == 'get_origin'
+    assert get_args.__name__ == get_args.__qualname__ == 'get_args'
+
+
+def test_get_args_callable_cached():
+    tp = TypingCallable[[int], str]
+    assert get_args(tp) == ([int], str)
+    # the reshaped arguments are only built once per alias
+    assert get_args(tp) is get_args(tp)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason='PEP585 generics only supported for python 3.9 and above.')
+def test_convert_generics_unchanged():
+    tp = Dict[str, Union[int, str]]
+    assert convert_generics(tp) is tp
+    # the cache must not mix up unions which only differ by the order of their arguments
+    assert get_args(convert_generics(Union[list['Hero'], int])) == (list[ForwardRef('Hero')], int)
+    assert get_args(convert_generics(Union[int, list['Hero']])) == (int, list[ForwardRef('Hero')])
+
+    convert_generics.cache_clear()
+    assert convert_generics(tp) is tp
+
+
+def test_star_import():
+    # names only defined for type checking must not be listed in `__all__`
+    namespace = {}
+    exec('from pydantic.typing import *', namespace)
+    assert 'get_args' in namespace
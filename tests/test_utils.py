@@ -3,7 +3,7 @@ import os
 import pickle
 import sys
 from copy import copy, deepcopy
-from typing import Callable, Dict, ForwardRef, List, NewType, Tuple, TypeVar, Union
+from typing import Callable, Dict, ForwardRef, List, NewType, Optional, Tuple, TypeVar, Union
 
 import pytest
 from typing_extensions import Annotated, Literal
@@ -13,7 +13,9 @@ from pydantic.color import Color
 from pydantic.dataclasses import dataclass
 from pydantic.fields import Undefined
 from pydantic.typing import (
+    _RESOLVE_CACHE,
     all_literal_values,
+    convert_generics,
     display_as_type,
     get_args,
     get_origin,
@@ -60,7 +62,17 @@ def test_import_no_attr():
 
 
 @pytest.mark.parametrize(
-    'value,expected', ((str, 'str'), ('string', 'str'), (Union[str, int], 'Union[str, int]'), (list, 'list'))
+    'value,expected',
+    (
+        (str, 'str'),
+        ('string', 'str'),
+        (Union[str, int], 'Union[str, int]'),
+        (list, 'list'),
+        (None, 'NoneType'),
+        (lambda: None, 'function'),
+        (List[int], 'List[int]'),
+        (type('Foo', (), {}), 'Foo'),
+    ),
 )
 def test_display_as_type(value, expected):
     assert display_as_type(value) == expected
@@ -71,6 +83,23 @@ def test_display_as_type_generic_alias():
     assert display_as_type(list[[Union[str, int]]]) == 'list[[Union[str, int]]]'
 
 
+def test_display_as_type_cache():
+    assert display_as_type(Union[str, int]) == 'Union[str, int]'
+    # equal to the union above, but displayed differently
+    assert display_as_type(Union[int, str]) == 'Union[int, str]'
+    assert display_as_type(Union[str, int]) == 'Union[str, int]'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason='generic aliases are not available in python < 3.9')
+def test_display_as_type_cache_convert_generics():
+    inner = Dict[str, list['DisplayHero']]  # noqa: F821
+    outer = Optional[inner]
+    assert display_as_type(outer) == "Union[Dict[str, list['DisplayHero']], NoneType]"
+    # converting the nested alias in place must not leave the outer display stale
+    convert_generics(inner)
+    assert display_as_type(outer) == "Union[Dict[str, list[ForwardRef('DisplayHero')]], NoneType]"
+
+
 def test_lenient_issubclass():
     class A(str):
         pass
@@ -379,6 +408,8 @@ def test_all_literal_values():
     L312 = Literal['3', Literal[L1, L2]]
     assert sorted(all_literal_values(L312)) == sorted(('1', '2', '3'))
 
+    assert all_literal_values(Literal[L312, 4, Literal[None, b'5']]) == ('3', '1', '2', 4, None, b'5')
+
 
 def test_path_type(tmp_path):
     assert path_type(tmp_path) == 'directory'
@@ -491,6 +522,67 @@ def test_resolve_annotations_no_module():
     assert resolve_annotations({'Foo': ForwardRef('Foo')}, None) == {'Foo': fr}
 
 
+def test_resolve_annotations_cache(create_module):
+    module = create_module(
+        # language=Python
+        """
+from typing import List
+"""
+    )
+    raw_annotations = {'a': int, 'b': List['Foo']}
+    resolved = resolve_annotations({'a': int}, module.__name__)
+    assert resolved == {'a': int}
+    cache_key = (module.__name__, (('a', id(int)),))
+    assert _RESOLVE_CACHE[cache_key][1] == {'a': int}
+    cached = resolve_annotations({'a': int}, module.__name__)
+    assert cached == {'a': int}
+    # callers get a copy they can modify without affecting the cache
+    assert cached is not resolved and cached is not _RESOLVE_CACHE[cache_key][1]
+
+    assert resolve_annotations(raw_annotations, module.__name__) == {'a': int, 'b': List[ForwardRef('Foo')]}
+
+    # annotations containing forward references aren't cached
+    class Foo:
+        pass
+
+    module.Foo = Foo
+    assert resolve_annotations(raw_annotations, module.__name__) == {'a': int, 'b': List[Foo]}
+
+
+def test_resolve_annotations_forward_ref_not_shared(create_module):
+    module = create_module(
+        # language=Python
+        """
+from typing import List
+
+Bar = List[int]
+"""
+    )
+    assert resolve_annotations({'x': 'Bar'}, module.__name__) == {'x': List[int]}
+    # the same string must not pick up the resolution from the module above
+    assert resolve_annotations({'x': 'Bar'}, None) == {'x': ForwardRef('Bar')}
+
+
+def test_resolve_annotations_class_names(create_module):
+    module = create_module(
+        # language=Python
+        """
+from typing import List
+
+class Spam:
+    pass
+
+Eggs = List['Spam']
+"""
+    )
+    assert resolve_annotations({'a': 'int', 'b': 'Spam', 'c': 'Eggs', 'd': 'Missing'}, module.__name__) == {
+        'a': int,
+        'b': module.Spam,
+        'c': List[module.Spam],
+        'd': ForwardRef('Missing'),
+    }
+
+
 def test_all_identical():
     a, b = object(), object()
     c = [b]